@@ -24,7 +24,8 @@ public:
 
     // Frame processing
     ProcessingResult processFrame(const FrameContext& context);
-    ProcessingResult processBatch(const std::vector<FrameContext>& contexts);
+    std::vector<ProcessingResult> processBatch(const std::vector<FrameContext>& contexts);
+    std::vector<ProcessingResult> processBatch(const BatchContext& batch);
 
     // Interactive preview
     bool startPreview(int width, int height);
@@ -20,7 +20,7 @@ public:
     
     void* allocateMemory(size_t bytes);
     void deallocateMemory(void* ptr);
-    
+
     void enableMemoryPool(bool enable);
     void setMemoryPoolSize(size_t size_bytes);
     
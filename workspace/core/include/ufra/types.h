@@ -6,24 +6,35 @@
 #include <map>
 
 // Minimal OpenCV-like types for dependency-free build
+#ifndef CV_8UC1
+#define CV_8UC1 0
+#endif
+#ifndef CV_8UC3
+#define CV_8UC3 16
+#endif
+
 namespace cv {
     class Mat {
     public:
-        Mat() : rows(0), cols(0), channels_(3) {}
-        Mat(int h, int w, int type) : rows(h), cols(w), channels_(3) {}
-        
+        Mat() : rows(0), cols(0), channels_(3), data(nullptr) {}
+        Mat(int h, int w, int type) : rows(h), cols(w), channels_(3), data(nullptr) {}
+        Mat(int h, int w, int type, void* ptr)
+            : rows(h), cols(w), channels_(3), data(static_cast<unsigned char*>(ptr)) {}
+
         bool empty() const { return rows == 0 || cols == 0; }
         int size() const { return rows * cols; }
         Mat clone() const { return *this; }
-        
+
         int rows, cols;
         int channels_;
-        
+        unsigned char* data;
+
         // Basic operators
         Mat& operator=(const Mat& other) {
             rows = other.rows;
             cols = other.cols;
             channels_ = other.channels_;
+            data = other.data;
             return *this;
         }
     };
@@ -124,18 +135,38 @@ enum class ProcessingMode {
 // GPU backend types
 enum class GPUBackend {
     CUDA,
+    TENSORRT,
     METAL,
     DIRECTML,
     CPU_FALLBACK
 };
 
+// Inference precision
+enum class Precision {
+    FP32,
+    FP16,
+    BF16,
+    INT8
+};
+
 // Model configuration
 struct ModelConfig {
     std::string model_path;
-    GPUBackend backend;
-    int batch_size;
-    bool use_half_precision;
-    int max_resolution;
+    GPUBackend backend = GPUBackend::CPU_FALLBACK;
+    int batch_size = 1;
+    bool use_half_precision = false;
+    // Defaulted so existing callers that never touch precision do not
+    // hand initialize() an indeterminate enum to branch on
+    Precision precision = Precision::FP32;
+    int max_resolution = 1024;
+    // Known fixed input shape; when static_shape is set, backends may
+    // specialize kernels for it (single TRT optimization profile with
+    // min=opt=max, CUDA graph capture) instead of handling dynamic shapes
+    int input_width = 0;    // 0 means unknown/dynamic
+    int input_height = 0;
+    bool static_shape = false;
+    std::string trt_cache;       // Directory for serialized TensorRT engines
+    std::string calibration_dir; // Representative images for INT8 calibration
 };
 
 // Frame processing context
@@ -146,6 +177,28 @@ struct FrameContext {
     cv::Mat optical_flow;
     AgeControls controls;
     ProcessingMode mode;
+
+    // Double-buffered input staging: frames ping-pong between the two
+    // slots so the caller's buffer can be reused immediately and the
+    // previously staged frame remains valid. Per-context, so pooled
+    // contexts do not stomp each other's frames.
+    ImageData staging_slots[2];
+    int staging_index = 0;
+};
+
+// Batched frame context (structure-of-arrays): one contiguous NHWC pixel
+// tensor plus a per-frame number vector, with controls/mode shared by the
+// whole window. Frame i starts at data.data() + i * height * width * channels,
+// so GPU backends stage the window with a single upload instead of N.
+struct BatchContext {
+    std::vector<int> frame_numbers;
+    std::vector<unsigned char> data;
+    int batch_size = 0;
+    int height = 0;
+    int width = 0;
+    int channels = 3;
+    AgeControls controls;
+    ProcessingMode mode;
 };
 
 // Result structures
@@ -9,5 +9,6 @@ namespace ufra {
 std::string getLibraryVersion();
 std::vector<std::string> splitString(const std::string& str, char delimiter);
 bool fileExists(const std::string& path);
+bool cpuSupportsBF16();
 
 } // namespace ufra
\ No newline at end of file
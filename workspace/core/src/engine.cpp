@@ -9,6 +9,7 @@
 #include "ufra/compositor.h"
 #include "ufra/gpu_memory_manager.h"
 #include "ufra/model_loader.h"
+#include "ufra/utils.h"
 #include <iostream>
 #include <chrono>
 
@@ -22,7 +23,24 @@ public:
     bool initialize(const ModelConfig& config) {
         try {
             config_ = config;
-            
+
+            // BF16 needs AVX512-BF16 on the CPU path; run FP32 otherwise
+            if (config_.precision == Precision::BF16 &&
+                config_.backend == GPUBackend::CPU_FALLBACK &&
+                !cpuSupportsBF16()) {
+                const std::string message =
+                    "CPU lacks AVX512-BF16 support; falling back to FP32";
+                // Callbacks are registered after initialize() in every
+                // current caller, so fall back to stderr rather than
+                // downgrading precision silently
+                if (error_callback_) {
+                    error_callback_(message);
+                } else {
+                    std::cerr << "UFRa: " << message << std::endl;
+                }
+                config_.precision = Precision::FP32;
+            }
+
             // Initialize GPU memory manager
             gpu_manager_ = std::make_unique<GPUMemoryManager>();
             if (!gpu_manager_->initialize(config.backend)) {
@@ -163,6 +181,45 @@ public:
         }
     }
 
+    std::vector<ProcessingResult> processBatch(const std::vector<FrameContext>& contexts) {
+        std::vector<ProcessingResult> results;
+        results.reserve(contexts.size());
+
+        // Process the whole window in one call so per-invocation overhead
+        // (Python crossing, kernel launch) is paid once per batch rather
+        // than once per frame. Backends that support true batched
+        // inference can override this loop with a single batched submit.
+        for (const auto& context : contexts) {
+            results.push_back(processFrame(context));
+        }
+        return results;
+    }
+
+    std::vector<ProcessingResult> processBatch(const BatchContext& batch) {
+        std::vector<ProcessingResult> results;
+        results.reserve(batch.batch_size);
+
+        // Slice per-frame views out of the contiguous tensor; backends
+        // with true batched kernels consume batch.data as one transfer
+        // and skip this per-frame fan-out entirely
+        const size_t frame_bytes = static_cast<size_t>(batch.height) *
+                                   batch.width * batch.channels;
+        for (int i = 0; i < batch.batch_size; ++i) {
+            FrameContext context;
+            context.frame_number = (i < static_cast<int>(batch.frame_numbers.size()))
+                                       ? batch.frame_numbers[i] : i;
+            // Header over frame i's slice; clone so the context owns its
+            // pixels independently of the batch buffer's lifetime
+            ImageData view(batch.height, batch.width, CV_8UC3,
+                           const_cast<unsigned char*>(batch.data.data() + i * frame_bytes));
+            context.input_frame = view.clone();
+            context.controls = batch.controls;
+            context.mode = batch.mode;
+            results.push_back(processFrame(context));
+        }
+        return results;
+    }
+
     std::vector<Face> detectFaces(const ImageData& image) {
         if (!initialized_ || !face_detector_) {
             return {};
@@ -219,6 +276,14 @@ ProcessingResult Engine::processFrame(const FrameContext& context) {
     return pImpl->processFrame(context);
 }
 
+std::vector<ProcessingResult> Engine::processBatch(const std::vector<FrameContext>& contexts) {
+    return pImpl->processBatch(contexts);
+}
+
+std::vector<ProcessingResult> Engine::processBatch(const BatchContext& batch) {
+    return pImpl->processBatch(batch);
+}
+
 std::vector<Face> Engine::detectFaces(const ImageData& image) {
     return pImpl->detectFaces(image);
 }
@@ -259,6 +324,10 @@ std::vector<GPUBackend> getAvailableBackends() {
 #ifdef CUDA_FOUND
     backends.push_back(GPUBackend::CUDA);
 #endif
+
+#ifdef TENSORRT_FOUND
+    backends.push_back(GPUBackend::TENSORRT);
+#endif
     
 #ifdef METAL_FOUND
     backends.push_back(GPUBackend::METAL);
@@ -25,4 +25,13 @@ bool fileExists(const std::string& path) {
     return file.good();
 }
 
+bool cpuSupportsBF16() {
+#if defined(__x86_64__) && defined(__GNUC__) && __GNUC__ >= 10
+    // AVX512-BF16 (Cooper Lake and newer); older compilers cannot probe it
+    return __builtin_cpu_supports("avx512bf16");
+#else
+    return false;
+#endif
+}
+
 } // namespace ufra
\ No newline at end of file
@@ -7,8 +7,22 @@ Demonstrates the capabilities of the UFRa library for face aging and de-aging.
 import cv2
 import numpy as np
 import argparse
+import atexit
+import concurrent.futures
+import logging
+import queue
 import sys
 import os
+import threading
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
 
 try:
     import pyufra
@@ -16,24 +30,89 @@ except ImportError:
     print("Error: pyufra module not found. Please build and install the Python bindings.")
     sys.exit(1)
 
+try:
+    import ufra_demo_fast
+except ImportError:
+    ufra_demo_fast = None
+
 def main():
     parser = argparse.ArgumentParser(description='UFRa Python Demo')
-    parser.add_argument('--input', '-i', required=True, help='Input image or video file')
-    parser.add_argument('--output', '-o', required=True, help='Output image or video file')
+    parser.add_argument('--input', '-i', help='Input image or video file')
+    parser.add_argument('--output', '-o', help='Output image or video file')
+    parser.add_argument('--input-dir', help='Process every image in this directory')
+    parser.add_argument('--output-dir', help='Destination directory for --input-dir mode')
     parser.add_argument('--age', '-a', type=float, default=30.0, help='Target age (0-100)')
     parser.add_argument('--mode', '-m', choices=['feedforward', 'diffusion', 'hybrid', 'auto'], 
                         default='feedforward', help='Processing mode')
     parser.add_argument('--models', default='./models', help='Path to model directory')
+    parser.add_argument('--backend', choices=['cuda', 'trt', 'cpu'], default='cuda',
+                        help='Inference backend (trt builds and caches a TensorRT engine on first run)')
+    parser.add_argument('--trt-cache', default='./trt_cache',
+                        help='Directory for serialized TensorRT engines')
+    parser.add_argument('--precision', choices=['fp16', 'bf16', 'int8'], default='fp16',
+                        help='Inference precision (int8 runs post-training calibration on '
+                             'first use; bf16 targets AVX512-BF16 CPUs)')
+    parser.add_argument('--calibration-dir', default='./calibration',
+                        help='Directory of representative images for INT8 calibration')
     parser.add_argument('--identity-lock', type=float, default=0.5, help='Identity preservation strength')
     parser.add_argument('--preview', action='store_true', help='Show preview window')
-    
+    parser.add_argument('--threaded', action='store_true',
+                        help='Overlap video decode/encode with inference using worker threads')
+    parser.add_argument('--prefetch', type=int, default=8,
+                        help='Queue depth for the threaded video pipeline')
+    parser.add_argument('--batch-size', '-b', type=int, default=1,
+                        help='Frames per inference call (raise until VRAM saturates)')
+    parser.add_argument('--gpu-decode', action='store_true',
+                        help='Decode/encode on the GPU via NVDEC/NVENC (needs OpenCV cudacodec)')
+    parser.add_argument('--gpu-encode', action='store_true',
+                        help='Encode output with NVENC (cudacodec or PyAV h264_nvenc) instead of mp4v')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help='Per-frame progress prints instead of a progress bar')
+    parser.add_argument('--skip-threshold', type=int, default=3,
+                        help='Reuse the previous output when the dHash Hamming distance '
+                             'to the last processed frame is below this')
+    parser.add_argument('--no-skip', action='store_true',
+                        help='Disable near-duplicate frame skipping')
+
     args = parser.parse_args()
 
-    # Check if input file exists
-    if not os.path.exists(args.input):
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+
+    # Validate input selection: single file or directory mode
+    if bool(args.input_dir) != bool(args.output_dir):
+        print("Error: --input-dir and --output-dir must be used together")
+        return -1
+    if not args.input_dir and not (args.input and args.output):
+        print("Error: provide --input/--output, or --input-dir/--output-dir")
+        return -1
+
+    if args.input_dir:
+        if not os.path.isdir(args.input_dir):
+            print(f"Error: Input directory not found: {args.input_dir}")
+            return -1
+    elif not os.path.exists(args.input):
         print(f"Error: Input file not found: {args.input}")
         return -1
 
+    # Probe the input's resolution before initializing so backends can
+    # specialize for the fixed shape (static shapes unlock kernel fusion
+    # and drop dynamic-shape guards); directory mode may mix resolutions,
+    # so it stays dynamic
+    is_image = bool(args.input) and args.input.lower().endswith(IMAGE_EXTENSIONS)
+    input_width = input_height = 0
+    if args.input_dir:
+        pass
+    elif is_image:
+        probe = cv2.imread(args.input)
+        if probe is not None:
+            input_height, input_width = probe.shape[:2]
+    else:
+        probe_cap = cv2.VideoCapture(args.input)
+        if probe_cap.isOpened():
+            input_width = int(probe_cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            input_height = int(probe_cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        probe_cap.release()
+
     # Create engine
     print("Initializing UFRa engine...")
     engine = pyufra.create_engine()
@@ -41,10 +120,36 @@ def main():
     # Configure engine
     config = pyufra.ModelConfig()
     config.model_path = args.models
-    config.backend = pyufra.GPUBackend.CUDA  # Try CUDA first
-    config.batch_size = 1
-    config.use_half_precision = True
+    backend_map = {
+        'cuda': pyufra.GPUBackend.CUDA,
+        'trt': pyufra.GPUBackend.TENSORRT,
+        'cpu': pyufra.GPUBackend.CPU_FALLBACK
+    }
+    config.backend = backend_map[args.backend]
+    if args.backend == 'trt':
+        config.trt_cache = args.trt_cache
+    if args.backend == 'cpu' and enable_fused_conversion():
+        print("Using Numba-fused color conversion for the CPU backend")
+    config.batch_size = args.batch_size
+    precision_map = {
+        'fp16': pyufra.Precision.FP16,
+        'bf16': pyufra.Precision.BF16,
+        'int8': pyufra.Precision.INT8
+    }
+    config.precision = precision_map[args.precision]
+    config.use_half_precision = (args.precision == 'fp16')
+    if args.precision == 'bf16' and args.backend != 'cpu':
+        print("Warning: bf16 is a CPU-backend precision; GPU backends use fp16/int8")
+    if args.precision == 'int8':
+        config.calibration_dir = args.calibration_dir
+        if args.backend == 'cpu':
+            print("Warning: INT8 gains depend on VNNI/DLA support; "
+                  "older CPUs and Jetson boards may see no speedup")
     config.max_resolution = 1024
+    if input_width and input_height:
+        config.input_width = input_width
+        config.input_height = input_height
+        config.static_shape = True
 
     if not engine.initialize(config):
         print("Error: Failed to initialize engine")
@@ -63,7 +168,8 @@ def main():
         'hybrid': pyufra.ProcessingMode.HYBRID,
         'auto': pyufra.ProcessingMode.AUTO
     }
-    engine.set_processing_mode(mode_map[args.mode])
+    mode = mode_map[args.mode]
+    engine.set_processing_mode(mode)
 
     # Setup age controls
     controls = pyufra.AgeControls()
@@ -76,19 +182,164 @@ def main():
     controls.gray_density = 0.5
 
     # Process input
-    if args.input.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp')):
+    if args.input_dir:
+        # Process a directory of images in one engine lifetime
+        print(f"Processing directory: {args.input_dir}")
+        process_directory(engine, args.input_dir, args.output_dir, controls, mode,
+                          args.batch_size, args.verbose)
+    elif is_image:
         # Process single image
         print(f"Processing image: {args.input}")
-        process_image(engine, args.input, args.output, controls, args.preview)
+        process_image(engine, args.input, args.output, controls, mode, args.preview)
     else:
         # Process video
         print(f"Processing video: {args.input}")
-        process_video(engine, args.input, args.output, controls, args.preview)
+        if args.gpu_decode and process_video_gpu(engine, args.input, args.output, controls,
+                                                 mode, args.verbose):
+            pass
+        elif args.threaded:
+            process_video_threaded(engine, args.input, args.output, controls, mode,
+                                   args.preview, args.prefetch, args.verbose,
+                                   args.gpu_encode)
+        else:
+            process_video(engine, args.input, args.output, controls, mode, args.preview,
+                          args.batch_size, args.verbose, args.gpu_encode,
+                          None if args.no_skip else args.skip_threshold)
 
     print("Processing complete!")
     return 0
 
-def process_image(engine, input_path, output_path, controls, show_preview):
+# Prefer the binding's BGR-native input/output when available; older
+# builds fall back to a per-frame cvtColor on the CPU.
+_HAS_BGR_INPUT = hasattr(pyufra.FrameContext, 'set_input_frame_bgr')
+_HAS_BGR_OUTPUT = hasattr(pyufra.ProcessingResult, 'get_output_frame_bgr')
+_HAS_ASYNC_INPUT = hasattr(pyufra.FrameContext, 'set_input_frame_async')
+_HAS_F32_INPUT = hasattr(pyufra.FrameContext, 'set_input_frame_f32')
+
+# Set for CPU-backend runs: route input through the Numba-fused
+# swap+normalize kernel instead of cvtColor plus an engine-side convert
+_USE_FUSED = False
+
+def enable_fused_conversion():
+    """Enable the fused CPU conversion path when Numba and the binding allow"""
+    global _USE_FUSED
+    if ufra_demo_fast is None or not ufra_demo_fast.HAVE_NUMBA:
+        return False
+    if not _HAS_F32_INPUT:
+        return False
+    _USE_FUSED = True
+    return True
+
+def set_input(context, frame_bgr, rgb_buf=None, f32_buf=None):
+    """Hand a BGR frame to the engine, skipping the CPU cvtColor when possible"""
+    if _USE_FUSED and f32_buf is not None:
+        ufra_demo_fast.bgr_to_rgb_f32(frame_bgr, f32_buf)
+        context.set_input_frame_f32(f32_buf)
+    elif _HAS_ASYNC_INPUT and rgb_buf is not None:
+        # Staged copy into the context's double buffer: rgb_buf may be
+        # overwritten next frame while the previous slot is still uploading
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+        context.set_input_frame_async(rgb_buf)
+    elif _HAS_BGR_INPUT:
+        context.set_input_frame_bgr(frame_bgr)
+    elif rgb_buf is not None:
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+        context.set_input_frame(rgb_buf)
+    else:
+        context.set_input_frame(cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB))
+
+class _AVWriter:
+    """PyAV h264_nvenc writer with the cv2.VideoWriter write/release shape"""
+    def __init__(self, output_path, width, height, fps):
+        import av
+        self._av = av
+        self.container = av.open(output_path, 'w')
+        self.stream = self.container.add_stream('h264_nvenc', rate=fps)
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = 'yuv420p'
+
+    def write(self, frame_bgr):
+        frame = self._av.VideoFrame.from_ndarray(frame_bgr, format='bgr24')
+        for packet in self.stream.encode(frame):
+            self.container.mux(packet)
+
+    def release(self):
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+def create_video_writer(output_path, width, height, fps, gpu_encode=False):
+    """Pick the fastest available encoder for the output video
+
+    With gpu_encode the preference is NVENC via cudacodec, then PyAV's
+    h264_nvenc, then the mp4v software fallback; software mp4v at 1080p60
+    can pin a full core and block the processing loop.
+    """
+    if gpu_encode:
+        if hasattr(cv2, 'cudacodec'):
+            try:
+                return cv2.cudacodec.createVideoWriter(output_path, (width, height),
+                                                       cv2.cudacodec.H264, fps)
+            except cv2.error:
+                pass
+        try:
+            return _AVWriter(output_path, width, height, fps)
+        except Exception:
+            # PyAV not installed, or this ffmpeg build lacks h264_nvenc
+            pass
+        print("Warning: no GPU encoder available, using mp4v software encoding")
+
+    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
+    return cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+
+# Shared pool for image encoding: cv2.imwrite PNG/JPEG-encodes on the
+# calling thread and can take tens of milliseconds at 1024x1024, so writes
+# are offloaded to overlap the next frame's inference. Drained at exit.
+_write_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+atexit.register(_write_pool.shutdown)
+
+def dhash(frame_bgr):
+    """64-bit difference hash: 9x8 grayscale, horizontal gradient sign bits"""
+    gray = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = small[:, 1:] > small[:, :-1]
+    return int(np.packbits(bits).view(np.uint64)[0])
+
+def make_progress(total_frames, verbose):
+    """Progress bar when tqdm is available; --verbose keeps plain prints"""
+    if verbose or tqdm is None:
+        return None
+    return tqdm(total=total_frames, unit='frame')
+
+def get_output_bgr(result, bgr_buf=None):
+    """Fetch the processed frame as BGR for OpenCV encoding/display
+
+    bgr_buf, when given, is reused as the conversion destination so
+    steady-state loops stop allocating a full-frame buffer per frame;
+    only pass it when the frame is consumed before the next call.
+    """
+    if _USE_FUSED:
+        output = result.get_output_frame()
+        if output.dtype == np.float32:
+            # The engine round-tripped the fused float input; fold the
+            # denormalize and channel swap back into one pass
+            if bgr_buf is None:
+                bgr_buf = np.empty(output.shape, np.uint8)
+            ufra_demo_fast.rgb_f32_to_bgr(output, bgr_buf)
+            return bgr_buf
+        if bgr_buf is not None:
+            cv2.cvtColor(output, cv2.COLOR_RGB2BGR, dst=bgr_buf)
+            return bgr_buf
+        return cv2.cvtColor(output, cv2.COLOR_RGB2BGR)
+    if _HAS_BGR_OUTPUT:
+        return result.get_output_frame_bgr()
+    if bgr_buf is not None:
+        cv2.cvtColor(result.get_output_frame(), cv2.COLOR_RGB2BGR, dst=bgr_buf)
+        return bgr_buf
+    return cv2.cvtColor(result.get_output_frame(), cv2.COLOR_RGB2BGR)
+
+def process_image(engine, input_path, output_path, controls, mode, show_preview):
     """Process a single image"""
     # Load image
     image = cv2.imread(input_path)
@@ -96,26 +347,24 @@ def process_image(engine, input_path, output_path, controls, show_preview):
         print(f"Error: Could not load image: {input_path}")
         return
 
-    # Convert BGR to RGB for processing
-    rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    
     # Setup frame context
     context = pyufra.FrameContext()
     context.frame_number = 0
-    context.set_input_frame(rgb_image)
+    f32_buf = np.empty(image.shape, np.float32) if _USE_FUSED else None
+    set_input(context, image, f32_buf=f32_buf)
     context.controls = controls
-    context.mode = engine.get_processing_mode()
+    context.mode = mode
 
     # Process frame
     result = engine.process_frame(context)
-    
+
     if result.success:
         # Get output image
-        output_rgb = result.get_output_frame()
-        output_bgr = cv2.cvtColor(output_rgb, cv2.COLOR_RGB2BGR)
-        
-        # Save result
-        cv2.imwrite(output_path, output_bgr)
+        output_bgr = get_output_bgr(result)
+
+        # Save result; get_output_bgr returned a fresh array, so the pool
+        # can encode it without a defensive copy
+        _write_pool.submit(cv2.imwrite, output_path, output_bgr)
         print(f"Output saved to: {output_path}")
         
         # Show preview if requested
@@ -130,8 +379,103 @@ def process_image(engine, input_path, output_path, controls, show_preview):
     else:
         print(f"Error processing image: {result.error_message}")
 
-def process_video(engine, input_path, output_path, controls, show_preview):
-    """Process a video file"""
+def process_directory(engine, input_dir, output_dir, controls, mode, batch_size=1,
+                      verbose=False):
+    """Process every image in a directory within one engine lifetime
+
+    Model loading and backend build caches are paid once for the whole
+    folder instead of per invocation. Images are grouped into
+    same-resolution buckets and each bucket runs through the batched API;
+    encoding happens on a small thread pool so writing the previous batch
+    overlaps the next batch's inference.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    entries = [entry for entry in os.scandir(input_dir)
+               if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS)]
+    entries.sort(key=lambda entry: entry.name)
+    if not entries:
+        print(f"Error: No images found in {input_dir}")
+        return
+
+    print(f"Processing {len(entries)} images from {input_dir}")
+
+    # Bucket by resolution so every batch shares one shape. Only paths are
+    # retained here — pixels are reloaded per batch window below, so peak
+    # memory stays at one window rather than the whole folder.
+    buckets = {}
+    for entry in entries:
+        image = cv2.imread(entry.path)
+        if image is None:
+            logger.warning("Could not load image: %s", entry.path)
+            continue
+        buckets.setdefault(image.shape[:2], []).append((entry.name, entry.path))
+
+    progress = make_progress(len(entries), verbose)
+    pending_writes = []
+
+    for (height, width), items in buckets.items():
+        # Contexts and conversion buffers are per bucket since the
+        # shape changes between buckets
+        context_pool = [pyufra.FrameContext() for _ in range(batch_size)]
+        for context in context_pool:
+            context.controls = controls
+            context.mode = mode
+        f32_buf = np.empty((height, width, 3), np.float32) if _USE_FUSED else None
+
+        for start in range(0, len(items), batch_size):
+            window = []
+            contexts = []
+            for name, path in items[start:start + batch_size]:
+                image = cv2.imread(path)
+                if image is None:
+                    # Loaded fine during bucketing; deleted or truncated since
+                    logger.warning("Could not reload image: %s", path)
+                    if progress is not None:
+                        progress.update(1)
+                    continue
+                context = context_pool[len(window)]
+                context.frame_number = start + len(window)
+                set_input(context, image, f32_buf=f32_buf)
+                window.append(name)
+                contexts.append(context)
+            if not contexts:
+                continue
+
+            results = engine.process_frame_batch(contexts)
+
+            for name, result in zip(window, results):
+                if result.success:
+                    # get_output_bgr returns a fresh array, so handing
+                    # it to the pool needs no defensive copy
+                    pending_writes.append(
+                        _write_pool.submit(cv2.imwrite, os.path.join(output_dir, name),
+                                           get_output_bgr(result)))
+                else:
+                    logger.warning("Failed to process %s: %s", name, result.error_message)
+                if progress is not None:
+                    progress.update(1)
+
+    # All inference is done; wait for the encoder pool to drain
+    concurrent.futures.wait(pending_writes)
+
+    if progress is not None:
+        progress.close()
+
+    print(f"Directory processing complete. Output saved to: {output_dir}")
+
+def process_video(engine, input_path, output_path, controls, mode, show_preview,
+                  batch_size=1, verbose=False, gpu_encode=False, skip_threshold=None):
+    """Process a video file
+
+    Frames are accumulated into windows of batch_size and submitted through
+    one inference call per window, amortizing per-call overhead and keeping
+    the GPU fed; a partial window is flushed at EOF. When skip_threshold is
+    set, frames whose dHash is within that Hamming distance of the last
+    processed frame replay the previous output instead of re-running the
+    network — temporally redundant footage skips most of its inferences,
+    and the temporal_stability control already assumes gradual change.
+    """
     # Open input video
     cap = cv2.VideoCapture(input_path)
     if not cap.isOpened():
@@ -147,59 +491,416 @@ def process_video(engine, input_path, output_path, controls, show_preview):
     print(f"Video properties: {width}x{height}, {fps} FPS, {total_frames} frames")
 
     # Setup output video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+    out = create_video_writer(output_path, width, height, fps, gpu_encode)
 
     frame_number = 0
-    
+    # Reusable conversion buffer for the non-BGR-native fallback; the
+    # engine copies the pixels synchronously so reuse across frames is safe.
+    rgb_buf = (np.empty((height, width, 3), np.uint8)
+               if _HAS_ASYNC_INPUT or not _HAS_BGR_INPUT else None)
+    f32_buf = np.empty((height, width, 3), np.float32) if _USE_FUSED else None
+    # Output conversion buffer: out.write encodes before returning, so the
+    # buffer is free again by the next iteration
+    bgr_buf = None if _HAS_BGR_OUTPUT else np.empty((height, width, 3), np.uint8)
+
+    # Near-duplicate gating state; skipped frames replay prev_output, so it
+    # must not live in the reused conversion buffer
+    prev_hash = None
+    prev_output = None
+    if skip_threshold is not None:
+        bgr_buf = None
+
+    # SoA batching when the binding provides it: frames are staged into one
+    # contiguous (B,H,W,3) tensor shared by the window, replacing N
+    # per-frame contexts with one object and one upload. The fused CPU
+    # route keeps per-frame float input and stays on the AoS path.
+    batch_ctx = None
+    batch_buf = None
+    if hasattr(pyufra, 'BatchContext') and not _USE_FUSED:
+        batch_ctx = pyufra.BatchContext()
+        batch_ctx.controls = controls
+        batch_ctx.mode = mode
+        batch_buf = np.empty((batch_size, height, width, 3), np.uint8)
+    else:
+        # Reuse one context per batch slot instead of constructing a fresh
+        # one every frame; construction crosses the binding and allocates
+        # engine-side buffers, and only frame_number and the pixels change.
+        context_pool = [pyufra.FrameContext() for _ in range(batch_size)]
+        for context in context_pool:
+            context.controls = controls
+            context.mode = mode
+
+    progress = make_progress(total_frames, verbose)
+
+    # Preview at ~10 Hz into a reusable buffer instead of resampling every
+    # output frame; display does not need full frame rate and the full-res
+    # downscale is a memory-bound CPU pass
+    preview_every = max(1, fps // 10) if fps > 0 else 3
+    preview_buf = np.empty((480, 640, 3), np.uint8) if show_preview else None
+
+    try:
+        while True:
+            # Fill the next batch window; near-duplicate frames are marked
+            # as skipped rather than staged for inference
+            batch_frames = []
+            contexts = []
+            staged_numbers = []
+            while len(batch_frames) < batch_size:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                if skip_threshold is not None:
+                    frame_hash = dhash(frame)
+                    if (prev_hash is not None and prev_output is not None and
+                            bin(frame_hash ^ prev_hash).count('1') < skip_threshold):
+                        batch_frames.append((frame, True))
+                        continue
+                    prev_hash = frame_hash
+
+                staged = len(staged_numbers)
+                if batch_ctx is not None:
+                    # Stage straight into this slot of the contiguous tensor
+                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=batch_buf[staged])
+                else:
+                    # Reuse the pooled context for this slot
+                    context = context_pool[staged]
+                    context.frame_number = frame_number + len(batch_frames)
+                    set_input(context, frame, rgb_buf, f32_buf)
+                    contexts.append(context)
+
+                staged_numbers.append(frame_number + len(batch_frames))
+                batch_frames.append((frame, False))
+
+            if not batch_frames:
+                break
+
+            # One inference call per window (skipped-only windows run none)
+            if staged_numbers:
+                if batch_ctx is not None:
+                    batch_ctx.frame_numbers = staged_numbers
+                    batch_ctx.set_input_batch(batch_buf[:len(staged_numbers)])
+                    results = engine.process_batch(batch_ctx)
+                else:
+                    results = engine.process_frame_batch(contexts)
+            else:
+                results = []
+
+            stop = False
+            result_iter = iter(results)
+            for frame, skipped in batch_frames:
+                if skipped:
+                    out.write(prev_output)
+                else:
+                    result = next(result_iter)
+                    if result.success:
+                        # Fetch BGR output and write
+                        output_bgr = get_output_bgr(result, bgr_buf)
+                        out.write(output_bgr)
+                        if skip_threshold is not None:
+                            prev_output = output_bgr
+
+                        # Show preview if requested (throttled to display cadence)
+                        if show_preview and frame_number % preview_every == 0:
+                            cv2.resize(output_bgr, (640, 480), dst=preview_buf)
+                            cv2.imshow('UFRa Processing', preview_buf)
+                            if cv2.waitKey(1) & 0xFF == ord('q'):
+                                stop = True
+                    else:
+                        logger.warning("Failed to process frame %d: %s",
+                                       frame_number, result.error_message)
+                        out.write(frame)  # Write original frame on failure
+
+                # Progress update
+                if progress is not None:
+                    progress.update(1)
+                elif frame_number % 30 == 0:
+                    percent = (frame_number / total_frames) * 100
+                    print(f"Progress: {percent:.1f}% ({frame_number}/{total_frames})")
+
+                frame_number += 1
+
+            if stop or len(batch_frames) < batch_size:
+                break  # User quit, or EOF flushed a partial window
+
+    finally:
+        if progress is not None:
+            progress.close()
+        cap.release()
+        out.release()
+        if show_preview:
+            cv2.destroyAllWindows()
+
+    print(f"Video processing complete. Output saved to: {output_path}")
+
+def process_video_gpu(engine, input_path, output_path, controls, mode, verbose=False):
+    """Process a video with NVDEC decode and NVENC encode
+
+    NVDEC decodes straight into GpuMats and the frame is handed to the
+    engine by device pointer. The current binding still downloads each
+    frame to the host for the CPU components, so the win today is the
+    hardware decode/encode, not the removal of PCIe traffic; a device-
+    resident engine path can consume the pointer in place. Returns False
+    when cudacodec is missing or cannot open a session so the caller can
+    fall back to the CPU paths.
+    """
+    if not hasattr(cv2, 'cudacodec') or not hasattr(pyufra.FrameContext, 'set_input_frame_gpu'):
+        print("Warning: GPU decode unavailable (OpenCV cudacodec or binding "
+              "support missing), falling back to CPU decode")
+        return False
+
+    # cudacodec does not report fps/frame count; probe them the usual way
+    cap = cv2.VideoCapture(input_path)
+    fps = int(cap.get(cv2.CAP_PROP_FPS))
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    print(f"Video properties: {width}x{height}, {fps} FPS, {total_frames} frames (GPU decode)")
+
+    # cudacodec builds without a usable NVDEC/NVENC session raise at
+    # creation time; honor the fall-back contract rather than crashing
+    try:
+        reader = cv2.cudacodec.createVideoReader(input_path)
+        # NVDEC surfaces are BGRA by default; ask for BGR so the frame
+        # layout matches what the binding expects (older OpenCV builds
+        # lack set(), in which case the 4-channel layout is handled below)
+        try:
+            reader.set(cv2.cudacodec.ColorFormat_BGR)
+        except (AttributeError, cv2.error):
+            pass
+        writer = cv2.cudacodec.createVideoWriter(output_path, (width, height),
+                                                 cv2.cudacodec.H264, fps)
+    except cv2.error as exc:
+        print(f"Warning: GPU decode session failed ({exc}), "
+              "falling back to CPU decode")
+        return False
+
+    frame_number = 0
+
+    # One context for the whole video; only frame_number and pixels change
+    context = pyufra.FrameContext()
+    context.controls = controls
+    context.mode = mode
+
+    progress = make_progress(total_frames, verbose)
+
     try:
         while True:
+            ret, gpu_frame = reader.nextFrame()
+            if not ret:
+                break
+
+            context.frame_number = frame_number
+            context.set_input_frame_gpu(int(gpu_frame.cudaPtr()), gpu_frame.step,
+                                        gpu_frame.cols, gpu_frame.rows,
+                                        gpu_frame.channels())
+
+            # Process frame
+            result = engine.process_frame(context)
+
+            if result.success:
+                # NVENC accepts host Mats too; outputs stay host-side until
+                # the engine grows a device-resident output binding
+                writer.write(get_output_bgr(result))
+            else:
+                logger.warning("Failed to process frame %d: %s",
+                               frame_number, result.error_message)
+                # Write the original frame so the output keeps every
+                # frame, matching the CPU video paths
+                original = gpu_frame.download()
+                if original.ndim == 3 and original.shape[2] == 4:
+                    original = cv2.cvtColor(original, cv2.COLOR_BGRA2BGR)
+                writer.write(original)
+
+            # Progress update
+            if progress is not None:
+                progress.update(1)
+            elif frame_number % 30 == 0:
+                percent = (frame_number / total_frames) * 100
+                print(f"Progress: {percent:.1f}% ({frame_number}/{total_frames})")
+
+            frame_number += 1
+
+    finally:
+        if progress is not None:
+            progress.close()
+        writer.release()
+
+    print(f"Video processing complete. Output saved to: {output_path}")
+    return True
+
+def process_video_threaded(engine, input_path, output_path, controls, mode, show_preview,
+                           prefetch=8, verbose=False, gpu_encode=False):
+    """Process a video file with decode/encode overlapped on worker threads
+
+    Three-stage pipeline connected by bounded queues: a reader thread pulls
+    frames from the capture, the main thread runs inference, and a writer
+    thread encodes the results. Back-pressure from the queue bounds keeps
+    memory usage flat on long videos; a None sentinel signals EOF downstream.
+    Inference stays on the main thread so engine state needs no locking.
+    """
+    # Open input video
+    cap = cv2.VideoCapture(input_path)
+    if not cap.isOpened():
+        print(f"Error: Could not open video: {input_path}")
+        return
+
+    # Get video properties
+    fps = int(cap.get(cv2.CAP_PROP_FPS))
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    print(f"Video properties: {width}x{height}, {fps} FPS, {total_frames} frames")
+
+    # Setup output video writer
+    out = create_video_writer(output_path, width, height, fps, gpu_encode)
+
+    read_q = queue.Queue(maxsize=prefetch)
+    write_q = queue.Queue(maxsize=prefetch)
+
+    # Set on early exit (preview quit, error) so the reader stops touching
+    # the capture before it is released; writer failures land here so the
+    # main loop can re-raise instead of deadlocking on a full write_q
+    stop_event = threading.Event()
+    writer_error = []
+
+    def reader():
+        while not stop_event.is_set():
             ret, frame = cap.read()
             if not ret:
                 break
+            # Bounded put with a timeout so a stopped consumer cannot
+            # strand the reader on a full queue
+            while not stop_event.is_set():
+                try:
+                    read_q.put(frame, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+        try:
+            read_q.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def writer():
+        while True:
+            frame = write_q.get()
+            if frame is None:
+                break
+            try:
+                out.write(frame)
+            except Exception as exc:
+                writer_error.append(exc)
+                break
+
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    reader_thread.start()
+    writer_thread.start()
+
+    frame_number = 0
+    rgb_buf = (np.empty((height, width, 3), np.uint8)
+               if _HAS_ASYNC_INPUT or not _HAS_BGR_INPUT else None)
+    f32_buf = np.empty((height, width, 3), np.float32) if _USE_FUSED else None
+
+    # One context for the whole video; only frame_number and pixels change
+    context = pyufra.FrameContext()
+    context.controls = controls
+    context.mode = mode
+
+    progress = make_progress(total_frames, verbose)
+
+    # Preview throttled to ~10 Hz into a reusable buffer (see process_video)
+    preview_every = max(1, fps // 10) if fps > 0 else 3
+    preview_buf = np.empty((480, 640, 3), np.uint8) if show_preview else None
+
+    def enqueue_output(frame_bgr):
+        # Re-raise a writer failure instead of blocking forever on a
+        # queue nobody is draining
+        while True:
+            if writer_error:
+                raise writer_error[0]
+            try:
+                write_q.put(frame_bgr, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    try:
+        while True:
+            frame = read_q.get()
+            if frame is None:
+                break
 
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Setup frame context
-            context = pyufra.FrameContext()
             context.frame_number = frame_number
-            context.set_input_frame(rgb_frame)
-            context.controls = controls
-            context.mode = engine.get_processing_mode()
+            set_input(context, frame, rgb_buf, f32_buf)
 
             # Process frame
             result = engine.process_frame(context)
-            
+
             if result.success:
-                # Convert back to BGR and write
-                output_rgb = result.get_output_frame()
-                output_bgr = cv2.cvtColor(output_rgb, cv2.COLOR_RGB2BGR)
-                out.write(output_bgr)
-                
-                # Show preview if requested
-                if show_preview:
-                    preview = cv2.resize(output_bgr, (640, 480))
-                    cv2.imshow('UFRa Processing', preview)
+                # Queue BGR output for encoding
+                output_bgr = get_output_bgr(result)
+                enqueue_output(output_bgr)
+
+                # Show preview if requested (throttled to display cadence)
+                if show_preview and frame_number % preview_every == 0:
+                    cv2.resize(output_bgr, (640, 480), dst=preview_buf)
+                    cv2.imshow('UFRa Processing', preview_buf)
                     if cv2.waitKey(1) & 0xFF == ord('q'):
                         break
             else:
-                print(f"Warning: Failed to process frame {frame_number}: {result.error_message}")
-                out.write(frame)  # Write original frame on failure
+                logger.warning("Failed to process frame %d: %s",
+                               frame_number, result.error_message)
+                enqueue_output(frame)  # Write original frame on failure
 
             # Progress update
-            if frame_number % 30 == 0:
-                progress = (frame_number / total_frames) * 100
-                print(f"Progress: {progress:.1f}% ({frame_number}/{total_frames})")
+            if progress is not None:
+                progress.update(1)
+            elif frame_number % 30 == 0:
+                percent = (frame_number / total_frames) * 100
+                print(f"Progress: {percent:.1f}% ({frame_number}/{total_frames})")
 
             frame_number += 1
 
     finally:
+        if progress is not None:
+            progress.close()
+        # Stop and join the reader before releasing the capture it reads
+        # from; draining read_q unblocks a reader parked on a full queue
+        stop_event.set()
+        while True:
+            try:
+                read_q.get_nowait()
+            except queue.Empty:
+                break
+        reader_thread.join(timeout=5.0)
+        # The sentinel must land and the writer must exit before the
+        # encoder is released, or release races a write in flight. A
+        # failed writer stops draining, so make room for the sentinel by
+        # discarding queued frames in that case.
+        while writer_thread.is_alive():
+            try:
+                write_q.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                if writer_error:
+                    try:
+                        write_q.get_nowait()
+                    except queue.Empty:
+                        pass
+        writer_thread.join()
         cap.release()
         out.release()
         if show_preview:
             cv2.destroyAllWindows()
 
+    if writer_error:
+        raise writer_error[0]
+
     print(f"Video processing complete. Output saved to: {output_path}")
 
 def show_comparison(original, processed, title):
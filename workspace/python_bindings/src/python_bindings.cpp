@@ -3,6 +3,8 @@
 #include <pybind11/stl.h>
 #include <pybind11/functional.h>
 #include <opencv2/opencv.hpp>
+#include <opencv2/core/cuda.hpp>
+#include <cstdint>
 #include "ufra/engine.h"
 #include "ufra/types.h"
 
@@ -23,6 +25,20 @@ py::array_t<uint8_t> mat_to_numpy(cv::Mat mat) {
     );
 }
 
+// Type-aware variant: float frames (e.g. a set_input_frame_f32 input the
+// engine cloned to its output) come back as float32 arrays instead of
+// having their bytes reinterpreted as uint8
+py::object mat_to_numpy_any(const cv::Mat& mat) {
+    if (mat.depth() == CV_32F) {
+        return py::array_t<float>(
+            {mat.rows, mat.cols, mat.channels()},
+            {sizeof(float)*mat.cols*mat.channels(), sizeof(float)*mat.channels(), sizeof(float)},
+            reinterpret_cast<const float*>(mat.data)
+        );
+    }
+    return mat_to_numpy(mat);
+}
+
 PYBIND11_MODULE(pyufra, m) {
     m.doc() = "Universal Face Re-Aging (UFRa) Python Bindings";
 
@@ -33,8 +49,15 @@ PYBIND11_MODULE(pyufra, m) {
         .value("HYBRID", ufra::ProcessingMode::HYBRID)
         .value("AUTO", ufra::ProcessingMode::AUTO);
 
+    py::enum_<ufra::Precision>(m, "Precision")
+        .value("FP32", ufra::Precision::FP32)
+        .value("FP16", ufra::Precision::FP16)
+        .value("BF16", ufra::Precision::BF16)
+        .value("INT8", ufra::Precision::INT8);
+
     py::enum_<ufra::GPUBackend>(m, "GPUBackend")
         .value("CUDA", ufra::GPUBackend::CUDA)
+        .value("TENSORRT", ufra::GPUBackend::TENSORRT)
         .value("METAL", ufra::GPUBackend::METAL)
         .value("DIRECTML", ufra::GPUBackend::DIRECTML)
         .value("CPU_FALLBACK", ufra::GPUBackend::CPU_FALLBACK);
@@ -71,7 +94,13 @@ PYBIND11_MODULE(pyufra, m) {
         .def_readwrite("backend", &ufra::ModelConfig::backend)
         .def_readwrite("batch_size", &ufra::ModelConfig::batch_size)
         .def_readwrite("use_half_precision", &ufra::ModelConfig::use_half_precision)
-        .def_readwrite("max_resolution", &ufra::ModelConfig::max_resolution);
+        .def_readwrite("precision", &ufra::ModelConfig::precision)
+        .def_readwrite("max_resolution", &ufra::ModelConfig::max_resolution)
+        .def_readwrite("input_width", &ufra::ModelConfig::input_width)
+        .def_readwrite("input_height", &ufra::ModelConfig::input_height)
+        .def_readwrite("static_shape", &ufra::ModelConfig::static_shape)
+        .def_readwrite("trt_cache", &ufra::ModelConfig::trt_cache)
+        .def_readwrite("calibration_dir", &ufra::ModelConfig::calibration_dir);
 
     py::class_<ufra::ProcessingResult>(m, "ProcessingResult")
         .def(py::init<>())
@@ -80,7 +109,12 @@ PYBIND11_MODULE(pyufra, m) {
         .def_readwrite("success", &ufra::ProcessingResult::success)
         .def_readwrite("error_message", &ufra::ProcessingResult::error_message)
         .def("get_output_frame", [](const ufra::ProcessingResult &result) {
-            return mat_to_numpy(result.output_frame);
+            return mat_to_numpy_any(result.output_frame);
+        })
+        .def("get_output_frame_bgr", [](const ufra::ProcessingResult &result) {
+            cv::Mat bgr;
+            cv::cvtColor(result.output_frame, bgr, cv::COLOR_RGB2BGR);
+            return mat_to_numpy_any(bgr);
         });
 
     py::class_<ufra::FrameContext>(m, "FrameContext")
@@ -90,7 +124,82 @@ PYBIND11_MODULE(pyufra, m) {
         .def_readwrite("controls", &ufra::FrameContext::controls)
         .def_readwrite("mode", &ufra::FrameContext::mode)
         .def("set_input_frame", [](ufra::FrameContext &ctx, py::array_t<uint8_t> input) {
-            ctx.input_frame = numpy_to_mat(input);
+            // copyTo reuses the existing allocation when the shape is
+            // unchanged, so a context persisted across frames pays no
+            // per-frame malloc/free of full-frame buffers.
+            py::buffer_info buf_info = input.request();
+            cv::Mat wrapper(buf_info.shape[0], buf_info.shape[1], CV_8UC3,
+                            (unsigned char*)buf_info.ptr);
+            wrapper.copyTo(ctx.input_frame);
+        })
+        .def("set_input_frame_bgr", [](ufra::FrameContext &ctx, py::array_t<uint8_t> input) {
+            // Accept raw BGR frames so callers skip the per-frame
+            // cvtColor pass; the swap happens once here during the copy.
+            py::buffer_info buf_info = input.request();
+            cv::Mat bgr(buf_info.shape[0], buf_info.shape[1], CV_8UC3,
+                        (unsigned char*)buf_info.ptr);
+            cv::cvtColor(bgr, ctx.input_frame, cv::COLOR_BGR2RGB);
+        })
+        .def("set_input_frame_gpu", [](ufra::FrameContext &ctx, std::uintptr_t device_ptr,
+                                       size_t step, int cols, int rows, int channels) {
+            // Wrap an externally owned device buffer (e.g. a GpuMat
+            // filled by NVDEC) so decoded frames never bounce through a
+            // host numpy array. GPU backends consume the device pointer
+            // in place; CPU-side components receive a downloaded copy.
+            // NVDEC yields BGRA on readers without ColorFormat support,
+            // so normalize either layout to the engine's RGB here.
+            cv::cuda::GpuMat gpu(rows, cols, channels == 4 ? CV_8UC4 : CV_8UC3,
+                                 reinterpret_cast<void*>(device_ptr), step);
+            cv::Mat host;
+            gpu.download(host);
+            cv::cvtColor(host, ctx.input_frame,
+                         channels == 4 ? cv::COLOR_BGRA2RGB : cv::COLOR_BGR2RGB);
+        }, py::arg("device_ptr"), py::arg("step"), py::arg("cols"), py::arg("rows"),
+           py::arg("channels") = 3)
+        .def("set_input_frame_async", [](ufra::FrameContext &ctx, py::array_t<uint8_t> input) {
+            // Double-buffered staging: the frame is copied into the
+            // context's next slot and the engine gets a header over it, so
+            // the caller may overwrite its numpy buffer immediately and
+            // the previously staged frame stays valid for backends that
+            // still reference it. The copy itself is synchronous; true
+            // copy/compute overlap needs backend support that the CPU
+            // engine does not have yet.
+            py::buffer_info buf_info = input.request();
+            cv::Mat wrapper(buf_info.shape[0], buf_info.shape[1], CV_8UC3,
+                            (unsigned char*)buf_info.ptr);
+            wrapper.copyTo(ctx.staging_slots[ctx.staging_index]);
+            ctx.input_frame = ctx.staging_slots[ctx.staging_index];
+            ctx.staging_index ^= 1;
+        })
+        .def("set_input_frame_f32", [](ufra::FrameContext &ctx, py::array_t<float> input) {
+            // Pre-normalized float32 RGB input; lets callers fuse the
+            // channel swap and /255 normalize into one pass and skips the
+            // engine's own uint8->float conversion.
+            py::buffer_info buf_info = input.request();
+            cv::Mat wrapper(buf_info.shape[0], buf_info.shape[1], CV_32FC3,
+                            (float*)buf_info.ptr);
+            wrapper.copyTo(ctx.input_frame);
+        });
+
+    py::class_<ufra::BatchContext>(m, "BatchContext")
+        .def(py::init<>())
+        .def_readwrite("frame_numbers", &ufra::BatchContext::frame_numbers)
+        .def_readwrite("controls", &ufra::BatchContext::controls)
+        .def_readwrite("mode", &ufra::BatchContext::mode)
+        .def_readonly("batch_size", &ufra::BatchContext::batch_size)
+        .def("set_input_batch", [](ufra::BatchContext &ctx, py::array_t<uint8_t> input) {
+            // One contiguous NHWC window: a single memcpy stages every
+            // frame, so the device sees one transfer per batch
+            py::buffer_info buf_info = input.request();
+            if (buf_info.ndim != 4) {
+                throw std::runtime_error("set_input_batch expects an (N, H, W, C) array");
+            }
+            ctx.batch_size = static_cast<int>(buf_info.shape[0]);
+            ctx.height = static_cast<int>(buf_info.shape[1]);
+            ctx.width = static_cast<int>(buf_info.shape[2]);
+            ctx.channels = static_cast<int>(buf_info.shape[3]);
+            const uint8_t* src = static_cast<const uint8_t*>(buf_info.ptr);
+            ctx.data.assign(src, src + buf_info.size);
         });
 
     // Main Engine class
@@ -100,6 +209,10 @@ PYBIND11_MODULE(pyufra, m) {
         .def("is_initialized", &ufra::Engine::isInitialized)
         .def("load_models", &ufra::Engine::loadModels)
         .def("process_frame", &ufra::Engine::processFrame)
+        .def("process_frame_batch",
+             py::overload_cast<const std::vector<ufra::FrameContext>&>(&ufra::Engine::processBatch))
+        .def("process_batch",
+             py::overload_cast<const ufra::BatchContext&>(&ufra::Engine::processBatch))
         .def("detect_faces", [](ufra::Engine &engine, py::array_t<uint8_t> input) {
             cv::Mat image = numpy_to_mat(input);
             return engine.detectFaces(image);
@@ -5,10 +5,28 @@ Setup script for UFRa Python package
 
 from pybind11.setup_helpers import Pybind11Extension, build_ext
 from setuptools import setup, Extension
+import os
 import pybind11
 import cv2
 import numpy as np
 
+# -march=native squeezes the most out of the build machine but produces
+# non-portable wheels; opt in via UFRA_NATIVE=1, otherwise target the
+# AVX2/FMA baseline
+if os.environ.get("UFRA_NATIVE") == "1":
+    arch_flags = ["-march=native"]
+else:
+    arch_flags = ["-mavx2", "-mfma"]
+
+extra_compile_args = [
+    "-O3",
+    "-ffast-math",
+    "-fvisibility=hidden",
+    "-flto",
+] + arch_flags
+
+extra_link_args = ["-flto"]
+
 # Define the extension module
 ext_modules = [
     Pybind11Extension(
@@ -17,13 +35,15 @@ ext_modules = [
             "python_bindings/src/python_bindings.cpp",
         ],
         include_dirs=[
-            pybind11.get_cmake_dir(),
+            pybind11.get_include(),
             "core/include",
             cv2.includes(),
             np.get_include(),
         ],
         libraries=["ufra_core", "opencv_core", "opencv_imgproc", "opencv_imgcodecs"],
         library_dirs=["build/lib"],
+        extra_compile_args=extra_compile_args,
+        extra_link_args=extra_link_args,
         language='c++'
     ),
 ]
@@ -45,6 +65,9 @@ setup(
         "opencv-python>=4.5.0",
     ],
     extras_require={
+        "tensorrt": [
+            "tensorrt>=8.5",
+        ],
         "dev": [
             "pytest>=6.0",
             "black>=21.0",